@@ -1,14 +1,17 @@
 import polars as pl
 import streamlit as st
 import logging
+import uuid
 
 from aco_camera_csv_converter.consts import (
-    REQUIRED_FILE_COLS_GEOGRAPHIC,
-    REQUIRED_FILE_COLS_CARTESIAN,
+    PREVIEW_ROWS,
+    REQUIRED_FILE_COLS_GEOGRAPHIC_SET,
+    REQUIRED_FILE_COLS_CARTESIAN_SET,
 )
 from aco_camera_csv_converter.models import TransformationParameters
 from aco_camera_csv_converter.services import (
     transformation_service,
+    CameraFileReader,
     CoordinateProcessor,
 )
 from aco_camera_csv_converter.ui import (
@@ -22,34 +25,86 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+@st.cache_data(show_spinner=False)
+def load_camera_file(data: bytes) -> pl.DataFrame:
+    """Parse uploaded file bytes, reusing the result across reruns."""
+    return CameraFileReader.read_csv(data)
+
+
+# The cache is shared by all sessions; a few entries covers concurrent users
+# while bounding how many encoded results are held in memory
+@st.cache_data(show_spinner=False, max_entries=4)
+def encode_converted_csv(_df: pl.DataFrame, conversion_id: str) -> str:
+    """Encode a conversion result as CSV once, however many reruns show it."""
+    return _df.write_csv()
+
+
 st.title("ACO Camera Reference Converter")
 
+# Fetch PROJ grid files once per session, up front, rather than on the first
+# conversion. If this fails (e.g. offline) the failure is remembered so reruns
+# don't retry it; the service retries when a transform actually runs.
+if "grid_sync_error" not in st.session_state:
+    try:
+        with st.spinner("Syncing PROJ grid files..."):
+            transformation_service.ensure_grid_files()
+        st.session_state.grid_sync_error = None
+    except OSError as e:
+        st.session_state.grid_sync_error = str(e)
+if st.session_state.grid_sync_error:
+    st.warning(f"Could not sync PROJ grid files: {st.session_state.grid_sync_error}")
+
 # File upload
 file = st.file_uploader("Riegel Camera Locations", type="csv")
 if file:
-    df = pl.read_csv(file, encoding="iso-8859-1")
+    # Parse, validate and inspect each upload once; later reruns reuse the
+    # validated frame from session state
+    if st.session_state.get("src_file_id") != file.file_id:
+        df = load_camera_file(file.getvalue())
 
-    # Validate file structure
-    FileValidationUI.validate_and_display_file(
-        df, REQUIRED_FILE_COLS_GEOGRAPHIC, REQUIRED_FILE_COLS_CARTESIAN
-    )
+        # Validate file structure
+        FileValidationUI.validate_and_display_file(
+            df, REQUIRED_FILE_COLS_GEOGRAPHIC_SET, REQUIRED_FILE_COLS_CARTESIAN_SET
+        )
+
+        try:
+            coord_type = CoordinateProcessor.detect_coord_type(df)
+        except ValueError as e:
+            st.error(str(e))
+            st.stop()
+
+        st.session_state.src_df = df
+        st.session_state.coord_type = coord_type
+        st.session_state.src_file_id = file.file_id
+        # Results belong to the previous upload
+        st.session_state.pop("converted_df", None)
 
-    st.session_state.src_df = df
     with st.expander("View uploaded file"):
-        st.dataframe(df)
+        st.dataframe(st.session_state.src_df.head(PREVIEW_ROWS))
+        st.caption(f"{st.session_state.src_df.height:,} rows total")
 
 name_only = st.toggle("Only update filenames", value=False)
 
-# Transformation parameters UI
-if not name_only:
+
+@st.fragment
+def render_transformation_parameters():
+    """Render the parameter widgets, rerunning only this section on changes."""
     st.write("## Transform Parameters")
     col1, col2 = st.columns(2, gap="medium")
 
     src_params = TransformationParametersUI.render_parameters(col1, "Source", "s")
     target_params = TransformationParametersUI.render_parameters(col2, "Target", "t")
 
-    # Combine parameters into TransformationParameters object
-    transformation_params = TransformationParameters(**src_params, **target_params)
+    # Combine parameters into TransformationParameters object, read by the
+    # Convert action on the next full rerun
+    st.session_state.transformation_params = TransformationParameters(
+        **src_params, **target_params
+    )
+
+
+# Transformation parameters UI
+if not name_only:
+    render_transformation_parameters()
 
 # Convert button and processing
 if st.button(
@@ -57,14 +112,16 @@ if st.button(
 ):
     if name_only:
         # Just update filenames without transformation
-        coord_type = CoordinateProcessor.detect_coord_type(st.session_state.src_df)
-        st.session_state.converted_df = CoordinateProcessor.preprocess_dataframe(
-            st.session_state.src_df, coord_type
+        st.session_state.converted_df = CoordinateProcessor.add_filename_columns(
+            st.session_state.src_df
         )
     else:
         # Perform full transformation
         st.session_state.converted_df = transformation_service.transform_coordinates(
-            st.session_state.src_df, transformation_params, should_transform=True
+            st.session_state.src_df,
+            st.session_state.transformation_params,
+            coord_type=st.session_state.coord_type,
+            should_transform=True,
         )
 
         # Display transformation inspection details
@@ -72,5 +129,20 @@ if st.button(
         if transformation_summary:
             InspectionUI.display_transformation_summary(transformation_summary)
 
+    # Identifies this result, so its CSV is encoded once and never reused for
+    # another conversion
+    st.session_state.conversion_id = uuid.uuid4().hex
     st.success("Conversion complete!")
-    st.dataframe(st.session_state.converted_df)
+
+# Show a preview of the result and offer the full file for download
+if file and "converted_df" in st.session_state:
+    converted_df = st.session_state.converted_df
+    st.dataframe(converted_df.head(PREVIEW_ROWS))
+    st.caption(f"{converted_df.height:,} rows total")
+    st.download_button(
+        "Download CSV",
+        data=encode_converted_csv(converted_df, st.session_state.conversion_id),
+        file_name=f"{file.name.removesuffix('.csv')}_converted.csv",
+        mime="text/csv",
+        use_container_width=True,
+    )
@@ -1,4 +1,5 @@
-from csrspy.enums import Reference, VerticalDatum
+import polars as pl
+from csrspy.enums import CoordType, Reference, VerticalDatum
 
 # Constants
 REQUIRED_FILE_COLS_GEOGRAPHIC = [
@@ -29,6 +30,42 @@ REQUIRED_FILE_COLS_CARTESIAN = [
     "Kappa[deg]",
 ]
 
+# Set forms of the required columns for fast membership checks; the ordered
+# lists above are kept for display
+REQUIRED_FILE_COLS_GEOGRAPHIC_SET = frozenset(REQUIRED_FILE_COLS_GEOGRAPHIC)
+REQUIRED_FILE_COLS_CARTESIAN_SET = frozenset(REQUIRED_FILE_COLS_CARTESIAN)
+
+# Columns whose presence marks a file as holding cartesian coordinates
+CARTESIAN_COORD_COLS = frozenset({"Origin (X[m]", "Y[m]", "Z[m])"})
+
+# DMS coordinate strings such as N52° 30' 45.2": hemisphere, degrees, minutes
+# and seconds. Anchored at both ends so trailing junk is rejected, not ignored
+DMS_PATTERN = r"^([NSEW])\s*(\d+)°\s*(\d+)'\s*(\d+(?:\.\d+)?)\"?\s*$"
+# Sign applied to DMS coordinates for each hemisphere letter
+HEMISPHERE_SIGNS = {"N": 1, "E": 1, "S": -1, "W": -1}
+# UTF-8 degree signs read as ISO-8859-1 appear as this two character sequence
+MOJIBAKE_DEGREE_SIGN = "Â°"
+# Number of leading rows inspected when detecting DMS coordinates
+DMS_DETECTION_SAMPLE_ROWS = 32
+
+# Known column dtypes in uploaded files, used to skip schema inference.
+# Latitude/Longitude are omitted since their dtype depends on whether they
+# hold DMS strings.
+FILE_COLUMN_DTYPES = {
+    "Timestamp": pl.String,
+    "Filename": pl.String,
+    "Altitude[m])": pl.Float64,
+    "Origin (X[m]": pl.Float64,
+    "Y[m]": pl.Float64,
+    "Z[m])": pl.Float64,
+    "Roll(X)[deg]": pl.Float64,
+    "Pitch(Y)[deg]": pl.Float64,
+    "Yaw(Z)[deg]": pl.Float64,
+    "Omega[deg]": pl.Float64,
+    "Phi[deg]": pl.Float64,
+    "Kappa[deg]": pl.Float64,
+}
+
 VERTICAL_DATUM_OPTS = [
     ("WGS84", VerticalDatum.WGS84),
     ("GRS80", VerticalDatum.GRS80),
@@ -57,3 +94,13 @@ REFERENCE_FRAME_OPTS = [
 ]
 
 COORD_TYPE_OPTS = ["Geographic", "Projected", "Cartesian"]
+
+# Number of rows rendered when previewing uploaded and converted files
+PREVIEW_ROWS = 200
+
+# Projected coordinate types keyed by UTM zone number
+UTM_ZONE_COORD_TYPES = {
+    int(coord_type.name[3:]): coord_type
+    for coord_type in CoordType
+    if coord_type.name.startswith("UTM")
+}
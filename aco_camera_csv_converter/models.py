@@ -1,10 +1,10 @@
-from dataclasses import dataclass
-from typing import List, Tuple, Literal
-import polars as pl
+from dataclasses import asdict, dataclass
+from typing import List, Optional, Tuple, Literal, Union
+import numpy as np
 from csrspy.enums import CoordType, Reference, VerticalDatum
 
 
-@dataclass
+@dataclass(frozen=True)
 class TransformationParameters:
     """Parameters for coordinate transformation."""
 
@@ -36,13 +36,21 @@ class CoordinateData:
     """Represents coordinate data for transformation."""
 
     coord_type: Literal["dms", "dd", "cart"]
-    coordinates: List[Tuple[float, float, float]]
+    coordinates: Union[np.ndarray, List[Tuple[float, float, float]]]
 
     def __post_init__(self):
         """Validate coordinate data."""
-        if not self.coordinates:
+        if len(self.coordinates) == 0:
             raise ValueError("Coordinates list cannot be empty")
 
+        # Arrays are validated on shape rather than row by row
+        if isinstance(self.coordinates, np.ndarray):
+            if self.coordinates.ndim != 2 or self.coordinates.shape[1] != 3:
+                raise ValueError(
+                    f"Coordinates array must have shape (N, 3), got {self.coordinates.shape}"
+                )
+            return
+
         # Validate each coordinate tuple has 3 values
         for i, coord in enumerate(self.coordinates):
             if len(coord) != 3:
@@ -51,31 +59,57 @@ class CoordinateData:
                 )
 
 
+@dataclass(frozen=True, slots=True)
+class InspectionRecord:
+    """Summary of the inputs handed to a transformation."""
+
+    source_reference_frame: str
+    source_coord_type: str
+    source_vertical_datum: str
+    source_epoch: float
+    target_reference_frame: str
+    target_coord_type: str
+    target_vertical_datum: str
+    target_epoch: float
+    coordinate_type: str
+    num_coordinates: int
+    first_coordinate: Optional[Tuple[float, float, float]]
+    last_coordinate: Optional[Tuple[float, float, float]]
+
+    def __getitem__(self, key: str):
+        """Allow dict-style field access, e.g. ``record["num_coordinates"]``."""
+        return getattr(self, key)
+
+    def to_dict(self) -> dict:
+        """Convert the record to a plain dict."""
+        return asdict(self)
+
+
 @dataclass
 class TransformationInput:
     """Complete input data for transformation inspection."""
 
     transformation_params: TransformationParameters
     coordinate_data: CoordinateData
-    original_df: pl.DataFrame
 
-    def get_summary(self) -> dict:
+    def get_summary(self) -> InspectionRecord:
         """Get a summary of transformation inputs for inspection."""
-        return {
-            "source_reference_frame": self.transformation_params.s_ref_frame.name,
-            "source_coord_type": self.transformation_params.s_coords.name,
-            "source_vertical_datum": self.transformation_params.s_vd.name,
-            "source_epoch": self.transformation_params.s_epoch,
-            "target_reference_frame": self.transformation_params.t_ref_frame.name,
-            "target_coord_type": self.transformation_params.t_coords.name,
-            "target_vertical_datum": self.transformation_params.t_vd.name,
-            "target_epoch": self.transformation_params.t_epoch,
-            "coordinate_type": self.coordinate_data.coord_type,
-            "num_coordinates": len(self.coordinate_data.coordinates),
-            "first_coordinate": self.coordinate_data.coordinates[0]
-            if self.coordinate_data.coordinates
+        coordinates = self.coordinate_data.coordinates
+        return InspectionRecord(
+            source_reference_frame=self.transformation_params.s_ref_frame.name,
+            source_coord_type=self.transformation_params.s_coords.name,
+            source_vertical_datum=self.transformation_params.s_vd.name,
+            source_epoch=self.transformation_params.s_epoch,
+            target_reference_frame=self.transformation_params.t_ref_frame.name,
+            target_coord_type=self.transformation_params.t_coords.name,
+            target_vertical_datum=self.transformation_params.t_vd.name,
+            target_epoch=self.transformation_params.t_epoch,
+            coordinate_type=self.coordinate_data.coord_type,
+            num_coordinates=len(coordinates),
+            first_coordinate=tuple(map(float, coordinates[0]))
+            if len(coordinates)
             else None,
-            "last_coordinate": self.coordinate_data.coordinates[-1]
-            if self.coordinate_data.coordinates
+            last_coordinate=tuple(map(float, coordinates[-1]))
+            if len(coordinates)
             else None,
-        }
+        )
@@ -1,113 +1,339 @@
+import hashlib
+import io
 import logging
-from typing import List, Tuple, Literal, Optional
+import re
+from itertools import chain, islice
+from pathlib import Path
+from typing import Dict, List, Literal, Optional, Union
+import numpy as np
 import polars as pl
+import pyproj.sync
 from csrspy import CSRSTransformer
 from csrspy.enums import CoordType
 from csrspy.utils import sync_missing_grid_files
 
+from aco_camera_csv_converter.consts import (
+    CARTESIAN_COORD_COLS,
+    DMS_DETECTION_SAMPLE_ROWS,
+    DMS_PATTERN,
+    FILE_COLUMN_DTYPES,
+    HEMISPHERE_SIGNS,
+    MOJIBAKE_DEGREE_SIGN,
+    REQUIRED_FILE_COLS_CARTESIAN,
+    REQUIRED_FILE_COLS_GEOGRAPHIC,
+)
 from aco_camera_csv_converter.models import (
     TransformationParameters,
     CoordinateData,
+    InspectionRecord,
     TransformationInput,
 )
 
 logger = logging.getLogger(__name__)
 
+_DMS_RE = re.compile(DMS_PATTERN)
+
+
+class CameraFileReader:
+    """Reads Riegel Camera Locations CSV files."""
+
+    ENCODING = "iso-8859-1"
+
+    @staticmethod
+    def read_csv(data: bytes) -> pl.DataFrame:
+        """Read only the required columns of a camera locations CSV."""
+        # Decode once up front; given an encoding, Polars would decode and copy
+        # the whole buffer on each read, even for a few sample rows
+        data = data.decode(CameraFileReader.ENCODING).encode()
+
+        # Read a few leading rows as strings to pick the columns and dtypes.
+        # Only those lines are handed over, as n_rows still scans the buffer
+        head = b"".join(islice(io.BytesIO(data), DMS_DETECTION_SAMPLE_ROWS + 1))
+        sample = pl.read_csv(
+            head,
+            infer_schema_length=0,
+        )
+
+        if CARTESIAN_COORD_COLS.issubset(sample.columns):
+            required_cols = REQUIRED_FILE_COLS_CARTESIAN
+        else:
+            required_cols = REQUIRED_FILE_COLS_GEOGRAPHIC
+        columns = [col for col in required_cols if col in sample.columns]
+
+        schema_overrides = {
+            col: FILE_COLUMN_DTYPES[col] for col in columns if col in FILE_COLUMN_DTYPES
+        }
+        # Geographic coordinates are strings in DMS files and floats otherwise,
+        # which is what detect_coord_type later relies on. If the sampled rows
+        # have no latitude at all, the format is left to a full inference pass
+        infer_schema_length = 100
+        if "Origin (Latitude[deg]" in columns:
+            latitudes = sample.get_column("Origin (Latitude[deg]")
+            if latitudes.null_count() == len(latitudes):
+                infer_schema_length = None
+            else:
+                geographic_dtype = (
+                    pl.String
+                    if CoordinateProcessor.is_dms_sample(latitudes)
+                    else pl.Float64
+                )
+                for col in ("Origin (Latitude[deg]", "Longitude[deg]"):
+                    if col in columns:
+                        schema_overrides[col] = geographic_dtype
+        # Skip inference entirely when every column has a known dtype
+        if len(schema_overrides) == len(columns):
+            infer_schema_length = 0
+        return pl.read_csv(
+            data,
+            columns=columns,
+            schema_overrides=schema_overrides,
+            infer_schema_length=infer_schema_length,
+        )
+
 
 class CoordinateProcessor:
     """Handles coordinate data preprocessing and format detection."""
 
+    @staticmethod
+    def _dms_arith(sign, degrees, minutes, seconds):
+        """Combine DMS parts into signed decimal degrees.
+
+        Works on floats and on Polars expressions alike, so the scalar and
+        vectorized parsers share one definition of the arithmetic.
+        """
+        return sign * (degrees + minutes / 60 + seconds / 3600)
+
     @staticmethod
     def dms_to_decimal(dms_str: str) -> float:
         """Convert DMS string to decimal degrees."""
-        direction = dms_str[0]
-        parts = dms_str[1:].replace('"', "").split("° ")
-        degrees = float(parts[0])
-        minutes, seconds = map(float, parts[1].split("' "))
-        decimal = degrees + minutes / 60 + seconds / 3600
-        return -decimal if direction in ["S", "W"] else decimal
+        match = _DMS_RE.match(dms_str.replace(MOJIBAKE_DEGREE_SIGN, "°"))
+        if match is None:
+            raise ValueError(f"Invalid DMS coordinate: {dms_str!r}")
+        hemisphere, degrees, minutes, seconds = match.groups()
+        return CoordinateProcessor._dms_arith(
+            HEMISPHERE_SIGNS[hemisphere], float(degrees), float(minutes), float(seconds)
+        )
+
+    @staticmethod
+    def dms_to_decimal_expr(column: Union[str, pl.Expr]) -> pl.Expr:
+        """Build a vectorized expression converting a DMS column to decimal degrees.
+
+        Values that are not valid DMS become null; validate_dms_columns checks
+        for them up front.
+        """
+        if isinstance(column, str):
+            column = pl.col(column)
+        parts = column.str.replace_all(
+            MOJIBAKE_DEGREE_SIGN, "°", literal=True
+        ).str.extract_groups(DMS_PATTERN)
+        hemisphere = parts.struct.field("1")
+        degrees = parts.struct.field("2").cast(pl.Float64)
+        minutes = parts.struct.field("3").cast(pl.Float64)
+        seconds = parts.struct.field("4").cast(pl.Float64)
+        # Table lookup rather than a per-row branch; the pattern only matches
+        # valid hemisphere letters
+        sign = hemisphere.replace_strict(HEMISPHERE_SIGNS, return_dtype=pl.Int8)
+        # Keep the input column's name rather than that of the sign literal
+        return CoordinateProcessor._dms_arith(sign, degrees, minutes, seconds).alias(
+            column.meta.output_name()
+        )
 
     @staticmethod
-    def detect_coord_type(df: pl.DataFrame) -> Literal["dms", "dd", "cart"]:
-        """Detect coordinate type from DataFrame columns."""
+    def validate_dms_columns(
+        df: Union[pl.DataFrame, pl.LazyFrame], columns: List[str]
+    ) -> None:
+        """Raise ValueError if a non-null value in the columns is not valid DMS."""
+        for column in columns:
+            values = pl.col(column)
+            invalid = (
+                df.lazy()
+                .select(values)
+                .with_row_index("row")
+                .filter(
+                    values.is_not_null()
+                    & CoordinateProcessor.dms_to_decimal_expr(values).is_null()
+                )
+                .head(1)
+                .collect()
+            )
+            if invalid.height:
+                row, value = invalid.row(0)
+                raise ValueError(
+                    f"Invalid DMS coordinate in {column!r} at row {row}: {value!r}"
+                )
+
+    @staticmethod
+    def is_dms_sample(values: pl.Series) -> bool:
+        """Check whether string coordinate values are written in DMS format."""
+        # The format is uniform across a file, so only the first non-null value
+        # needs to be inspected
+        sample = values.drop_nulls().head(1)
+        return len(sample) > 0 and "°" in sample.item(0)
+
+    @staticmethod
+    def detect_coord_type(
+        df: Union[pl.DataFrame, pl.LazyFrame],
+    ) -> Literal["dms", "dd", "cart"]:
+        """Detect coordinate type from DataFrame columns and dtypes.
+
+        Raises ValueError if the latitude column holds text that is not DMS.
+        """
+        schema = df.collect_schema()
         # Check if file has cartesian coordinates
-        if (
-            "Origin (X[m]" in df.columns
-            and "Y[m]" in df.columns
-            and "Z[m])" in df.columns
-        ):
+        if CARTESIAN_COORD_COLS.issubset(schema.names()):
             return "cart"
-        # Check if geographic coordinates are in DMS format
-        elif (
-            "Origin (Latitude[deg]" in df.columns
-            and df["Origin (Latitude[deg]"].dtype == pl.String
-            and df["Origin (Latitude[deg]"].str.contains("°").any()
-        ):
+        # Numeric coordinates are decimal degrees, decided from the schema alone
+        latitude_dtype = schema.get("Origin (Latitude[deg]")
+        if latitude_dtype is None or latitude_dtype.is_numeric():
+            return "dd"
+        # Text coordinates must be DMS; only the first value anywhere in the
+        # column is read, and an empty column has nothing that could misparse
+        first = (
+            df.lazy()
+            .select(pl.col("Origin (Latitude[deg]").drop_nulls().first())
+            .collect()
+            .to_series()
+        )
+        if first.null_count() == len(first) or CoordinateProcessor.is_dms_sample(first):
             return "dms"
-        return "dd"
+        raise ValueError(
+            "Could not detect coordinate type: latitude values are text "
+            "but not in DMS format"
+        )
+
+    @staticmethod
+    def _filename_exprs() -> List[pl.Expr]:
+        """Expressions deriving the RGBI and RGB image filenames."""
+        stem = pl.col("Filename").str.strip_suffix(".iiq")
+        return [
+            (stem + "_rgbi.tif").alias("RGBI_Filename"),
+            (stem + "_cal.tif").alias("RGB_Filename"),
+        ]
+
+    @staticmethod
+    def add_filename_columns(
+        df: Union[pl.DataFrame, pl.LazyFrame],
+    ) -> Union[pl.DataFrame, pl.LazyFrame]:
+        """Add image filename columns, leaving coordinates untouched.
+
+        Works on eager and lazy frames alike, returning the same kind of frame.
+        """
+        return df.with_columns(*CoordinateProcessor._filename_exprs())
 
     @staticmethod
     def preprocess_dataframe(
-        df: pl.DataFrame, coord_type: Literal["dms", "dd", "cart"]
-    ) -> pl.DataFrame:
-        """Preprocess DataFrame to normalize coordinate formats."""
-        processed_df = df.clone()
+        df: Union[pl.DataFrame, pl.LazyFrame],
+        coord_type: Literal["dms", "dd", "cart"],
+    ) -> pl.LazyFrame:
+        """Preprocess DataFrame to normalize coordinate formats.
+
+        Returns a LazyFrame so callers decide when the result is materialized.
+        """
+        # Add filename transformations
+        exprs = CoordinateProcessor._filename_exprs()
 
         # Convert DMS to decimal if needed
         if coord_type == "dms":
-            processed_df = processed_df.with_columns(
-                pl.col("Origin (Latitude[deg]").map_elements(
-                    CoordinateProcessor.dms_to_decimal, return_dtype=pl.Float64
-                ),
-                pl.col("Longitude[deg]").map_elements(
-                    CoordinateProcessor.dms_to_decimal, return_dtype=pl.Float64
-                ),
+            # Fail loudly rather than carrying unparseable values on as nulls
+            CoordinateProcessor.validate_dms_columns(
+                df, ["Origin (Latitude[deg]", "Longitude[deg]"]
             )
+            exprs += [
+                CoordinateProcessor.dms_to_decimal_expr("Origin (Latitude[deg]"),
+                CoordinateProcessor.dms_to_decimal_expr("Longitude[deg]"),
+            ]
 
-        # Add filename transformations
-        processed_df = processed_df.with_columns(
-            pl.col("Filename")
-            .str.replace_all(".iiq", "_rgbi.tif", literal=True)
-            .alias("RGBI_Filename"),
-            pl.col("Filename")
-            .str.replace_all(".iiq", "_cal.tif", literal=True)
-            .alias("RGB_Filename"),
-        )
+        # Evaluate all columns in a single parallel pass
+        return df.lazy().with_columns(*exprs)
 
-        return processed_df
+    @staticmethod
+    def _coordinate_columns(coord_type: Literal["dms", "dd", "cart"]) -> List[str]:
+        """Names of the coordinate columns, in CSRSTransformer input order."""
+        if coord_type == "cart":
+            return ["Origin (X[m]", "Y[m]", "Z[m])"]
+        # For geographic coordinates, return as (lon, lat, alt) for CSRSTransformer
+        return ["Longitude[deg]", "Origin (Latitude[deg]", "Altitude[m])"]
 
     @staticmethod
     def extract_coordinates(
-        df: pl.DataFrame, coord_type: Literal["dms", "dd", "cart"]
-    ) -> List[Tuple[float, float, float]]:
-        """Extract coordinate tuples from DataFrame."""
-        if coord_type == "cart":
-            return list(
-                zip(
-                    df["Origin (X[m]"].to_list(),
-                    df["Y[m]"].to_list(),
-                    df["Z[m])"].to_list(),
-                )
-            )
-        else:
-            # For geographic coordinates, return as (lon, lat, alt) for CSRSTransformer
-            return list(
-                zip(
-                    df["Longitude[deg]"].to_list(),
-                    df["Origin (Latitude[deg]"].to_list(),
-                    df["Altitude[m])"].to_list(),
-                )
-            )
+        df: Union[pl.DataFrame, pl.LazyFrame],
+        coord_type: Literal["dms", "dd", "cart"],
+    ) -> np.ndarray:
+        """Extract an (N, 3) float64 array of coordinates from DataFrame."""
+        coords = df.select(CoordinateProcessor._coordinate_columns(coord_type))
+        # Only the coordinate columns are materialized from a lazy frame
+        if isinstance(coords, pl.LazyFrame):
+            coords = coords.collect()
+        return coords.to_numpy()
+
+
+class GridFileManager:
+    """Keeps the PROJ grid files needed for transformations available."""
+
+    MARKER_NAME = ".aco_grids_synced"
+
+    @staticmethod
+    def fingerprint(directory: Path) -> str:
+        """Hash the names and sizes of the grid files in a directory."""
+        entries = sorted(
+            f"{path.name}:{path.stat().st_size}"
+            for path in directory.iterdir()
+            if path.is_file() and path.name != GridFileManager.MARKER_NAME
+        )
+        return hashlib.sha256("\n".join(entries).encode()).hexdigest()
+
+    @staticmethod
+    def sync(directory: Optional[Path] = None) -> None:
+        """Sync missing grid files, unless a completed sync is still intact."""
+        if directory is None:
+            directory = Path(pyproj.sync.get_user_data_dir(create=True))
+        marker = directory / GridFileManager.MARKER_NAME
+
+        # Skip the network round-trip if no files changed since the last sync
+        fingerprint = GridFileManager.fingerprint(directory)
+        if marker.exists() and marker.read_text() == fingerprint:
+            logger.info("PROJ grid files already synced.")
+            return
+
+        sync_missing_grid_files()
+        marker.write_text(GridFileManager.fingerprint(directory))
 
 
 class TransformationService:
     """Handles coordinate transformations with inspection capabilities."""
 
+    # Maximum number of distinct parameter sets to keep transformers for
+    MAX_CACHED_TRANSFORMERS = 8
+
+    # Number of points handed to the transformer per call
+    TRANSFORM_CHUNK_SIZE = 50_000
+
     def __init__(self, enable_inspection: bool = True):
         self.enable_inspection = enable_inspection
         self.last_transformation_input: Optional[TransformationInput] = None
-
-    def inspect_transformation_input(self) -> Optional[dict]:
+        self._transformers: Dict[TransformationParameters, CSRSTransformer] = {}
+        self._grid_files_synced = False
+
+    def ensure_grid_files(self) -> None:
+        """Sync missing PROJ grid files once for the lifetime of the service."""
+        if not self._grid_files_synced:
+            GridFileManager.sync()
+            self._grid_files_synced = True
+
+    def get_transformer(
+        self, transformation_params: TransformationParameters
+    ) -> CSRSTransformer:
+        """Get a CSRSTransformer for the parameters, reusing a cached one if present."""
+        transformer = self._transformers.get(transformation_params)
+        if transformer is None:
+            if len(self._transformers) >= self.MAX_CACHED_TRANSFORMERS:
+                # Evict the oldest entry
+                self._transformers.pop(next(iter(self._transformers)))
+            transformer = CSRSTransformer(**transformation_params.to_csrspy_kwargs())
+            self._transformers[transformation_params] = transformer
+        return transformer
+
+    def inspect_transformation_input(self) -> Optional[InspectionRecord]:
         """Get inspection data for the last transformation."""
         if self.last_transformation_input is None:
             return None
@@ -121,22 +347,36 @@ class TransformationService:
         should_transform: bool = True,
     ) -> pl.DataFrame:
         """Transform coordinates with inspection capabilities."""
-        # Ensure grid files are available
-        sync_missing_grid_files()
+        return self.transform_coordinates_lazy(
+            df.lazy(), transformation_params, coord_type, should_transform
+        ).collect()
+
+    def transform_coordinates_lazy(
+        self,
+        lf: pl.LazyFrame,
+        transformation_params: TransformationParameters,
+        coord_type: Optional[Literal["dms", "dd", "cart"]] = None,
+        should_transform: bool = True,
+    ) -> pl.LazyFrame:
+        """Build a lazy plan of transformed coordinates, collected by the caller."""
+        # Release the previous inspection data before building new arrays
+        self.last_transformation_input = None
+        log_details = self.enable_inspection and logger.isEnabledFor(logging.INFO)
+
+        # Only add filenames if no transformation is needed, keeping the
+        # coordinates exactly as uploaded
+        if not should_transform:
+            return CoordinateProcessor.add_filename_columns(lf)
 
         # Auto-detect coordinate type if not provided
         if coord_type is None:
-            coord_type = CoordinateProcessor.detect_coord_type(df)
+            coord_type = CoordinateProcessor.detect_coord_type(lf)
 
-        # Preprocess the dataframe
-        processed_df = CoordinateProcessor.preprocess_dataframe(df, coord_type)
+        # Preprocess the frame; filename and DMS columns are derived in one pass
+        processed_lf = CoordinateProcessor.preprocess_dataframe(lf, coord_type)
 
-        # Return early if no transformation is needed
-        if not should_transform:
-            return processed_df
-
-        # Extract coordinates for transformation
-        coordinates = CoordinateProcessor.extract_coordinates(processed_df, coord_type)
+        # Extract coordinates for transformation, collecting only those columns
+        coordinates = CoordinateProcessor.extract_coordinates(processed_lf, coord_type)
         coordinate_data = CoordinateData(coord_type=coord_type, coordinates=coordinates)
 
         # Store transformation input for inspection
@@ -144,18 +384,19 @@ class TransformationService:
             self.last_transformation_input = TransformationInput(
                 transformation_params=transformation_params,
                 coordinate_data=coordinate_data,
-                original_df=df,
             )
 
-            # Log transformation details
+        # Log transformation details
+        if log_details:
             summary = self.last_transformation_input.get_summary()
             logger.info(f"Transformation Input Summary: {summary}")
 
-        # Create and configure transformer
-        transformer = CSRSTransformer(**transformation_params.to_csrspy_kwargs())
+        # Ensure grid files are available, then get a configured transformer
+        self.ensure_grid_files()
+        transformer = self.get_transformer(transformation_params)
 
         # Log transformer configuration
-        if self.enable_inspection:
+        if log_details:
             logger.info("CSRSTransformer configured with:")
             logger.info(
                 f"  Source: {transformer.s_ref_frame.name} ({transformer.s_coords.name}) @ {transformer.s_epoch}"
@@ -166,45 +407,87 @@ class TransformationService:
             logger.info(f"  Processing {len(coordinates)} coordinate points")
 
         # Perform transformation
-        transformed_coords = list(transformer(coordinates))
+        transformed_coords = self._run_transformer(transformer, coordinates)
 
         # Log sample results
-        if self.enable_inspection and transformed_coords:
+        if log_details and len(transformed_coords):
             logger.info("Sample transformation result:")
             logger.info(f"  Input:  {coordinates[0]}")
             logger.info(f"  Output: {transformed_coords[0]}")
 
-        # Apply transformed coordinates back to dataframe
+        # Apply transformed coordinates back to the lazy plan
         return self._apply_transformed_coordinates(
-            processed_df, transformed_coords, transformer.t_coords, coord_type
+            processed_lf, transformed_coords, transformer.t_coords, coord_type
         )
 
+    @staticmethod
+    def transform_points(
+        transformer: CSRSTransformer, points: np.ndarray
+    ) -> np.ndarray:
+        """Transform an (N, 3) array with whole-array calls into PROJ.
+
+        This relies on csrspy internals (the `transformers` pipelines and their
+        `transforms`, `direction` and `s_epoch` attributes), which is why csrspy
+        is pinned to 0.7.x; tests check it against `CSRSTransformer.__call__`.
+        """
+        pipelines = getattr(transformer, "transformers", None)
+        if not isinstance(pipelines, list):
+            # Not a csrspy pipeline chain; use the per-point iterator interface
+            return np.fromiter(
+                chain.from_iterable(transformer(points)),
+                dtype=np.float64,
+                count=points.size,
+            ).reshape(-1, 3)
+
+        # Mirror CSRSTransformer.__call__: each pipeline starts its points at
+        # its own source epoch and applies its pyproj transforms in order, but
+        # on coordinate arrays rather than one point at a time
+        x, y, z = (np.array(column) for column in points.T)
+        for pipeline in pipelines:
+            t = np.full(len(points), pipeline.s_epoch, dtype=np.float64)
+            for trans in pipeline.transforms:
+                x, y, z, t = trans.transform(x, y, z, t, direction=pipeline.direction)
+        return np.column_stack((x, y, z))
+
+    def _run_transformer(
+        self, transformer: CSRSTransformer, coordinates: np.ndarray
+    ) -> np.ndarray:
+        """Transform an (N, 3) array in chunks of TRANSFORM_CHUNK_SIZE points."""
+        # Column-major so each output column is contiguous and can be handed
+        # to Polars without copying
+        transformed = np.empty(coordinates.shape, dtype=np.float64, order="F")
+        for start in range(0, len(coordinates), self.TRANSFORM_CHUNK_SIZE):
+            chunk = coordinates[start : start + self.TRANSFORM_CHUNK_SIZE]
+            transformed[start : start + len(chunk)] = self.transform_points(
+                transformer, chunk
+            )
+        return transformed
+
     def _apply_transformed_coordinates(
         self,
-        df: pl.DataFrame,
-        transformed_coords: List[Tuple[float, float, float]],
+        lf: pl.LazyFrame,
+        transformed_coords: np.ndarray,
         target_coord_type: CoordType,
         original_coord_type: Literal["dms", "dd", "cart"],
-    ) -> pl.DataFrame:
-        """Apply transformed coordinates back to the DataFrame."""
-        # Convert to polars Series
-        coords_series = pl.Series("converted", transformed_coords)
-        df_with_coords = df.with_columns(coords_series)
+    ) -> pl.LazyFrame:
+        """Apply transformed coordinates back to the lazy frame."""
+        # The drop, new columns and final projection stay in one lazy plan so
+        # they are optimized together and materialized once by the caller
 
         # Remove original coordinate columns
         if original_coord_type == "cart":
-            df_with_coords = df_with_coords.drop("Origin (X[m]", "Y[m]", "Z[m])")
+            lf = lf.drop("Origin (X[m]", "Y[m]", "Z[m])")
         else:
-            df_with_coords = df_with_coords.drop(
-                "Origin (Latitude[deg]", "Longitude[deg]", "Altitude[m])"
-            )
+            lf = lf.drop("Origin (Latitude[deg]", "Longitude[deg]", "Altitude[m])")
+
+        x, y, z = transformed_coords.T
 
         # Add new coordinate columns based on target type
         if target_coord_type == CoordType.GEOG:
-            return df_with_coords.with_columns(
-                pl.col("converted").list.get(1).alias("Origin (Latitude[deg]"),
-                pl.col("converted").list.get(0).alias("Longitude[deg]"),
-                pl.col("converted").list.get(2).alias("Altitude[m])"),
+            return lf.with_columns(
+                pl.Series("Origin (Latitude[deg]", y),
+                pl.Series("Longitude[deg]", x),
+                pl.Series("Altitude[m])", z),
             ).select(
                 "Timestamp",
                 "Filename",
@@ -219,10 +502,10 @@ class TransformationService:
                 "Kappa[deg]",
             )
         elif target_coord_type == CoordType.CART:
-            return df_with_coords.with_columns(
-                pl.col("converted").list.get(0).alias("Origin (X[m]"),
-                pl.col("converted").list.get(1).alias("Y[m]"),
-                pl.col("converted").list.get(2).alias("Z[m])"),
+            return lf.with_columns(
+                pl.Series("Origin (X[m]", x),
+                pl.Series("Y[m]", y),
+                pl.Series("Z[m])", z),
             ).select(
                 "Timestamp",
                 "RGBI_Filename",
@@ -238,10 +521,10 @@ class TransformationService:
                 "Yaw(Z)[deg]",
             )
         else:  # Projected coordinates
-            return df_with_coords.with_columns(
-                pl.col("converted").list.get(0).alias("Easting[m]"),
-                pl.col("converted").list.get(1).alias("Northing[m]"),
-                pl.col("converted").list.get(2).alias("Altitude[m]"),
+            return lf.with_columns(
+                pl.Series("Easting[m]", x),
+                pl.Series("Northing[m]", y),
+                pl.Series("Altitude[m]", z),
             ).select(
                 "Timestamp",
                 "RGBI_Filename",
@@ -3,11 +3,13 @@ from csrspy.enums import CoordType
 from csrspy.utils import date_to_decimal_year
 
 from aco_camera_csv_converter.consts import (
+    CARTESIAN_COORD_COLS,
     COORD_TYPE_OPTS,
     REFERENCE_FRAME_OPTS,
+    UTM_ZONE_COORD_TYPES,
     VERTICAL_DATUM_OPTS,
 )
-from aco_camera_csv_converter.models import TransformationParameters
+from aco_camera_csv_converter.models import InspectionRecord, TransformationParameters
 
 
 class TransformationParametersUI:
@@ -62,7 +64,7 @@ class TransformationParametersUI:
 
         # Handle coordinate type conversion
         if coords == "Projected":
-            coord_type = list(CoordType)[utm_zone - 1]
+            coord_type = UTM_ZONE_COORD_TYPES[utm_zone]
         elif coords == "Cartesian":
             coord_type = CoordType.CART
         else:
@@ -95,14 +97,18 @@ class FileValidationUI:
     @staticmethod
     def validate_and_display_file(df, required_cols_geo, required_cols_cart):
         """Validate uploaded file and display appropriate messages."""
-        missing_cols_geo = set(required_cols_geo) - set(df.columns)
-        missing_cols_cart = set(required_cols_cart) - set(df.columns)
+        # Only check the column set matching the file's coordinate columns
+        if CARTESIAN_COORD_COLS.issubset(df.columns):
+            flavour = "Cartesian"
+            missing_cols = required_cols_cart.difference(df.columns)
+        else:
+            flavour = "Geographic"
+            missing_cols = required_cols_geo.difference(df.columns)
 
-        if missing_cols_geo and missing_cols_cart:
+        if missing_cols:
             st.error(
-                f"Missing columns in uploaded file. Expected either:\n"
-                f"Geographic: {list(missing_cols_geo)}\n"
-                f"Or Cartesian: {list(missing_cols_cart)}"
+                f"Missing columns in uploaded file. Expected {flavour}: "
+                f"{list(missing_cols)}"
             )
             st.stop()
 
@@ -113,7 +119,7 @@ class InspectionUI:
     """Handles transformation inspection display."""
 
     @staticmethod
-    def display_transformation_summary(transformation_summary: dict):
+    def display_transformation_summary(transformation_summary: InspectionRecord):
         """Display transformation input summary in an expander."""
         with st.expander("🔍 Transformation Details"):
             st.write("**Source Parameters:**")
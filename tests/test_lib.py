@@ -0,0 +1,75 @@
+import numpy as np
+import pytest
+import polars as pl
+from unittest.mock import patch
+
+from aco_camera_csv_converter import lib
+from csrspy import CSRSTransformer
+from csrspy.enums import Reference, VerticalDatum, CoordType
+
+# Matching source and target epochs need no PROJ grid files
+TRANSFORMER_KWARGS = {
+    "s_ref_frame": Reference.ITRF14,
+    "s_coords": CoordType.GEOG,
+    "s_epoch": 2020.0,
+    "s_vd": VerticalDatum.GRS80,
+    "t_ref_frame": Reference.NAD83CSRS,
+    "t_coords": CoordType.UTM10,
+    "t_epoch": 2020.0,
+    "t_vd": VerticalDatum.GRS80,
+}
+
+
+class TestConvertCoords:
+    """Test the legacy convert_coords function."""
+
+    @pytest.fixture
+    def sample_geographic_df(self):
+        """Sample geographic DataFrame."""
+        return pl.DataFrame(
+            {
+                "Timestamp": ["2023-01-01", "2023-01-02"],
+                "Filename": ["img1.iiq", "img2.iiq"],
+                "Origin (Latitude[deg]": [50.0, 50.1],
+                "Longitude[deg]": [-125.0, -125.1],
+                "Altitude[m])": [100.0, 150.0],
+                "Roll(X)[deg]": [0.0, 1.0],
+                "Pitch(Y)[deg]": [0.0, 1.0],
+                "Yaw(Z)[deg]": [0.0, 1.0],
+                "Omega[deg]": [0.0, 1.0],
+                "Phi[deg]": [0.0, 1.0],
+                "Kappa[deg]": [0.0, 1.0],
+            }
+        )
+
+    def test_repeated_calls_with_real_transformer(self, sample_geographic_df):
+        """Test that convert_coords can run repeatedly in one process."""
+        expected = list(
+            CSRSTransformer(**TRANSFORMER_KWARGS)(
+                [(-125.0, 50.0, 100.0), (-125.1, 50.1, 150.0)]
+            )
+        )
+
+        with patch("aco_camera_csv_converter.services.GridFileManager.sync"):
+            results = [
+                lib.convert_coords(sample_geographic_df, "dd", **TRANSFORMER_KWARGS)
+                for _ in range(3)
+            ]
+
+        for result in results:
+            assert result.columns[3:6] == ["Easting[m]", "Northing[m]", "Altitude[m]"]
+            assert result["RGBI_Filename"].to_list() == [
+                "img1_rgbi.tif",
+                "img2_rgbi.tif",
+            ]
+            np.testing.assert_allclose(
+                result.select("Easting[m]", "Northing[m]", "Altitude[m]").to_numpy(),
+                expected,
+            )
+
+    def test_no_transformation_mode(self, sample_geographic_df):
+        """Test that filename-only mode leaves coordinates untouched."""
+        result = lib.convert_coords(sample_geographic_df, should_transform=False)
+
+        assert result["RGB_Filename"].to_list() == ["img1_cal.tif", "img2_cal.tif"]
+        assert result["Longitude[deg]"].to_list() == [-125.0, -125.1]
@@ -1,9 +1,11 @@
+import numpy as np
 import pytest
 from csrspy.enums import Reference, VerticalDatum, CoordType
 
 from aco_camera_csv_converter.models import (
     TransformationParameters,
     CoordinateData,
+    InspectionRecord,
     TransformationInput,
 )
 
@@ -49,6 +51,16 @@ class TestCoordinateData:
         assert coord_data.coord_type == "dd"
         assert coord_data.coordinates == coords
 
+    def test_array_coordinate_data(self):
+        """Test coordinate data creation from an (N, 3) array."""
+        coords = np.array([[123.45, 67.89, 100.0], [124.45, 68.89, 101.0]])
+        coord_data = CoordinateData(coord_type="dd", coordinates=coords)
+
+        assert coord_data.coordinates is coords
+
+        with pytest.raises(ValueError, match="must have shape \\(N, 3\\)"):
+            CoordinateData(coord_type="dd", coordinates=coords[:, :2])
+
     def test_empty_coordinates_raises_error(self):
         """Test that empty coordinates list raises ValueError."""
         with pytest.raises(ValueError, match="Coordinates list cannot be empty"):
@@ -98,22 +110,9 @@ class TestTransformationInput:
 
     def test_get_summary(self, sample_transformation_params, sample_coordinate_data):
         """Test transformation input summary generation."""
-        import polars as pl
-
-        df = pl.DataFrame(
-            {
-                "Timestamp": ["2023-01-01", "2023-01-02"],
-                "Filename": ["img1.iiq", "img2.iiq"],
-                "Origin (Latitude[deg]": [67.89, 68.89],
-                "Longitude[deg]": [123.45, 124.45],
-                "Altitude[m])": [100.0, 101.0],
-            }
-        )
-
         transformation_input = TransformationInput(
             transformation_params=sample_transformation_params,
             coordinate_data=sample_coordinate_data,
-            original_df=df,
         )
 
         summary = transformation_input.get_summary()
@@ -133,4 +132,6 @@ class TestTransformationInput:
             "last_coordinate": (124.45, 68.89, 101.0),
         }
 
-        assert summary == expected_summary
+        assert isinstance(summary, InspectionRecord)
+        assert summary.to_dict() == expected_summary
+        assert summary["num_coordinates"] == summary.num_coordinates == 2
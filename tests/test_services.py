@@ -1,12 +1,105 @@
+import numpy as np
 import pytest
 import polars as pl
 from unittest.mock import Mock, patch
 
-from aco_camera_csv_converter.services import CoordinateProcessor, TransformationService
+from aco_camera_csv_converter.services import (
+    CameraFileReader,
+    CoordinateProcessor,
+    GridFileManager,
+    TransformationService,
+)
 from aco_camera_csv_converter.models import TransformationParameters
+from csrspy import CSRSTransformer
 from csrspy.enums import Reference, VerticalDatum, CoordType
 
 
+class TestCameraFileReader:
+    """Test CameraFileReader class."""
+
+    def test_read_csv_applies_known_dtypes(self):
+        """Test that recognized columns are read with their known dtypes."""
+        csv_text = (
+            "Timestamp,Filename,Origin (Latitude[deg],Longitude[deg],"
+            "Altitude[m]),Kappa[deg]\n"
+            "2023-01-01,img1.iiq,N52° 30' 45\",W123° 15' 30\",100,1\n"
+        )
+        df = CameraFileReader.read_csv(csv_text.encode("iso-8859-1"))
+
+        assert df.schema["Timestamp"] == pl.String
+        assert df.schema["Altitude[m])"] == pl.Float64
+        assert df.schema["Kappa[deg]"] == pl.Float64
+        assert df.schema["Origin (Latitude[deg]"] == pl.String
+        assert df["Origin (Latitude[deg]"][0] == "N52° 30' 45\""
+        assert (
+            df.get_column("Origin (Latitude[deg]").item(0)
+            == df["Origin (Latitude[deg]"][0]
+        )
+
+    def test_read_csv_decimal_degrees_as_float(self):
+        """Test that decimal degree coordinates are read as floats."""
+        csv_text = (
+            "Timestamp,Filename,Origin (Latitude[deg],Longitude[deg],Altitude[m])\n"
+            "2023-01-01,img1.iiq,52.5125,-123.258333,100\n"
+        )
+        df = CameraFileReader.read_csv(csv_text.encode("iso-8859-1"))
+
+        assert df.schema["Origin (Latitude[deg]"] == pl.Float64
+        assert df.schema["Longitude[deg]"] == pl.Float64
+
+    def test_read_csv_dms_after_empty_rows(self):
+        """Test that DMS values after blank leading rows are still read."""
+        header = (
+            "Timestamp,Filename,Origin (Latitude[deg],Longitude[deg],Altitude[m])\n"
+        )
+        csv_text = (
+            header
+            + "2023-01-01,img0.iiq,,,100\n" * 150
+            + "2023-01-01,img1.iiq,N52° 30' 45\",W123° 15' 30\",100\n"
+        )
+        df = CameraFileReader.read_csv(csv_text.encode("iso-8859-1"))
+
+        assert df.schema["Origin (Latitude[deg]"] == pl.String
+        assert df["Longitude[deg]"][-1] == "W123° 15' 30\""
+        assert CoordinateProcessor.detect_coord_type(df) == "dms"
+
+    def test_read_csv_decodes_once(self):
+        """Test that the upload is decoded once and never again by Polars."""
+
+        class CountingBytes(bytes):
+            decode_calls = 0
+
+            def decode(self, *args, **kwargs):
+                CountingBytes.decode_calls += 1
+                return super().decode(*args, **kwargs)
+
+        csv_text = (
+            "Timestamp,Filename,Origin (Latitude[deg],Longitude[deg],Altitude[m])\n"
+            "2023-01-01,img1.iiq,N52° 30' 45\",W123° 15' 30\",100\n"
+        )
+        data = CountingBytes(csv_text.encode("iso-8859-1"))
+
+        with patch(
+            "aco_camera_csv_converter.services.pl.read_csv", wraps=pl.read_csv
+        ) as mock_read:
+            df = CameraFileReader.read_csv(data)
+
+        assert CountingBytes.decode_calls == 1
+        assert all("encoding" not in call.kwargs for call in mock_read.call_args_list)
+        assert df["Origin (Latitude[deg]"][0] == "N52° 30' 45\""
+
+    def test_read_csv_skips_unused_columns(self):
+        """Test that only the required cartesian columns are read."""
+        csv_text = (
+            "Timestamp,Filename,Origin (X[m],Y[m],Z[m]),Notes\n"
+            "2023-01-01,img1.iiq,500000,6000000,100,ignored\n"
+        )
+        df = CameraFileReader.read_csv(csv_text.encode("iso-8859-1"))
+
+        assert df.columns == ["Timestamp", "Filename", "Origin (X[m]", "Y[m]", "Z[m])"]
+        assert df.schema["Origin (X[m]"] == pl.Float64
+
+
 class TestCoordinateProcessor:
     """Test CoordinateProcessor class."""
 
@@ -22,6 +115,54 @@ class TestCoordinateProcessor:
         expected = -(123 + 15 / 60 + 30 / 3600)
         assert abs(result - expected) < 1e-10
 
+    def test_dms_to_decimal_expr_matches_scalar(self):
+        """Test vectorized DMS conversion matches the scalar implementation."""
+        values = ["N52° 30' 45\"", "S12° 5' 7.5\"", "W123° 15' 30\"", "E1° 0' 0\""]
+        df = pl.DataFrame({"dms": values})
+
+        result = df.select(CoordinateProcessor.dms_to_decimal_expr("dms"))["dms"]
+
+        expected = [CoordinateProcessor.dms_to_decimal(v) for v in values]
+        assert result.to_list() == pytest.approx(expected, abs=1e-10)
+
+    def test_dms_to_decimal_expr_mojibake_degree_sign(self):
+        """Test DMS strings with a mis-decoded degree sign are still parsed."""
+        df = pl.DataFrame({"dms": ["N52Â° 30' 45\"", "W123Â° 15' 30\""]})
+
+        result = df.select(CoordinateProcessor.dms_to_decimal_expr("dms"))["dms"]
+
+        assert result.to_list() == pytest.approx(
+            [52 + 30 / 60 + 45 / 3600, -(123 + 15 / 60 + 30 / 3600)], abs=1e-10
+        )
+        assert CoordinateProcessor.dms_to_decimal("N52Â° 30' 45\"") == pytest.approx(
+            result[0]
+        )
+
+    def test_dms_to_decimal_invalid(self):
+        """Test that malformed DMS strings raise ValueError."""
+        with pytest.raises(ValueError, match="Invalid DMS coordinate"):
+            CoordinateProcessor.dms_to_decimal("52.5")
+
+    def test_preprocess_dataframe_invalid_dms(self):
+        """Test that malformed DMS values raise instead of becoming null."""
+        df = pl.DataFrame(
+            {
+                "Filename": ["a.iiq", "b.iiq", "c.iiq"],
+                "Origin (Latitude[deg]": ["N52° 30' 45\"", None, "garbage"],
+                "Longitude[deg]": ["W123° 15' 30\"", None, "W123° 15' 30\""],
+            }
+        )
+
+        with pytest.raises(ValueError, match="at row 2: 'garbage'"):
+            CoordinateProcessor.preprocess_dataframe(df, "dms")
+
+        # Malformed seconds must be reported too, not fail the float cast
+        df = df.with_columns(pl.lit("N52° 30' 4.5.6\"").alias("Origin (Latitude[deg]"))
+        with pytest.raises(ValueError, match="at row 0"):
+            CoordinateProcessor.preprocess_dataframe(df, "dms")
+        with pytest.raises(ValueError, match="Invalid DMS coordinate"):
+            CoordinateProcessor.dms_to_decimal("N52° 30' 4.5.6\"")
+
     def test_detect_coord_type_cartesian(self):
         """Test detection of cartesian coordinates."""
         df = pl.DataFrame(
@@ -41,6 +182,53 @@ class TestCoordinateProcessor:
         result = CoordinateProcessor.detect_coord_type(df)
         assert result == "dms"
 
+    def test_detect_coord_type_dms_with_leading_null(self):
+        """Test DMS detection is not fooled by a missing first value."""
+        df = pl.DataFrame(
+            {
+                "Origin (Latitude[deg]": [None, "N52° 30' 45\""],
+                "Longitude[deg]": [None, "W123° 15' 30\""],
+            }
+        )
+        result = CoordinateProcessor.detect_coord_type(df)
+        assert result == "dms"
+
+    def test_detect_coord_type_empty_frame(self):
+        """Test numeric coordinates are detected from the schema alone."""
+        df = pl.DataFrame(
+            {"Origin (Latitude[deg]": [52.5125], "Longitude[deg]": [-123.258333]}
+        ).head(0)
+
+        result = CoordinateProcessor.detect_coord_type(df)
+        assert result == "dd"
+
+    def test_detect_coord_type_all_null_text(self):
+        """Test that a text latitude column without values is not rejected."""
+        df = pl.DataFrame(
+            {"Origin (Latitude[deg]": [None, None], "Longitude[deg]": [None, None]},
+            schema={"Origin (Latitude[deg]": pl.String, "Longitude[deg]": pl.String},
+        )
+
+        result = CoordinateProcessor.detect_coord_type(df)
+        assert result == "dms"
+
+    def test_detect_coord_type_decimal_strings(self):
+        """Test that text coordinates not in DMS format are rejected."""
+        df = pl.DataFrame(
+            {"Origin (Latitude[deg]": ["52.5125"], "Longitude[deg]": ["-123.258333"]}
+        )
+
+        with pytest.raises(ValueError, match="not in DMS format"):
+            CoordinateProcessor.detect_coord_type(df)
+
+    def test_is_dms_sample(self):
+        """Test DMS detection on raw string values."""
+        dms = pl.Series([None, "N52° 30' 45\""])
+        decimal = pl.Series(["52.5125"])
+
+        assert CoordinateProcessor.is_dms_sample(dms)
+        assert not CoordinateProcessor.is_dms_sample(decimal)
+
     def test_detect_coord_type_decimal_degrees(self):
         """Test detection of decimal degree coordinates."""
         df = pl.DataFrame(
@@ -59,7 +247,7 @@ class TestCoordinateProcessor:
             }
         )
 
-        result = CoordinateProcessor.preprocess_dataframe(df, "dms")
+        result = CoordinateProcessor.preprocess_dataframe(df, "dms").collect()
 
         # Check that DMS coordinates were converted to decimal
         assert isinstance(result["Origin (Latitude[deg]"][0], float)
@@ -71,6 +259,40 @@ class TestCoordinateProcessor:
         assert result["RGBI_Filename"][0] == "test_rgbi.tif"
         assert result["RGB_Filename"][0] == "test_cal.tif"
 
+    def test_preprocess_dataframe_dms_bulk(self):
+        """Test vectorized DMS preprocessing over a large frame."""
+        n_rows = 10_000
+        df = pl.DataFrame(
+            {
+                "Filename": [f"img{i}.iiq" for i in range(n_rows)],
+                "Origin (Latitude[deg]": ["N52° 30' 45\"", "S12° 5' 7.5\""]
+                * (n_rows // 2),
+                "Longitude[deg]": ["W123° 15' 30\"", "E1° 0' 0\""] * (n_rows // 2),
+            }
+        )
+
+        result = CoordinateProcessor.preprocess_dataframe(df, "dms").collect()
+
+        assert result.schema["Origin (Latitude[deg]"] == pl.Float64
+        assert result["Origin (Latitude[deg]"][:2].to_list() == pytest.approx(
+            [52 + 30 / 60 + 45 / 3600, -(12 + 5 / 60 + 7.5 / 3600)]
+        )
+        assert result["Longitude[deg]"][-2:].to_list() == pytest.approx(
+            [-(123 + 15 / 60 + 30 / 3600), 1.0]
+        )
+        assert result["Origin (Latitude[deg]"].null_count() == 0
+
+    def test_dms_to_decimal_expr_accepts_expression(self):
+        """Test DMS conversion of an expression keeps the column name."""
+        df = pl.DataFrame({"dms": ["  N52° 30' 45\""]})
+
+        result = df.select(
+            CoordinateProcessor.dms_to_decimal_expr(pl.col("dms").str.strip_chars())
+        )
+
+        assert result.columns == ["dms"]
+        assert result["dms"][0] == pytest.approx(52 + 30 / 60 + 45 / 3600)
+
     def test_preprocess_dataframe_decimal_degrees(self):
         """Test preprocessing of decimal degree coordinates."""
         df = pl.DataFrame(
@@ -81,7 +303,7 @@ class TestCoordinateProcessor:
             }
         )
 
-        result = CoordinateProcessor.preprocess_dataframe(df, "dd")
+        result = CoordinateProcessor.preprocess_dataframe(df, "dd").collect()
 
         # Check that coordinates remain as decimal
         assert result["Origin (Latitude[deg]"][0] == 52.5125
@@ -91,6 +313,26 @@ class TestCoordinateProcessor:
         assert result["RGBI_Filename"][0] == "test_rgbi.tif"
         assert result["RGB_Filename"][0] == "test_cal.tif"
 
+    def test_add_filename_columns_bulk(self):
+        """Test vectorized filename derivation over a large frame."""
+        n_rows = 50_000
+        df = pl.DataFrame({"Filename": [f"img{i:05d}.iiq" for i in range(n_rows)]})
+
+        result = CoordinateProcessor.add_filename_columns(df)
+
+        assert result["RGBI_Filename"][0] == "img00000_rgbi.tif"
+        assert result["RGB_Filename"][-1] == "img49999_cal.tif"
+        assert result["RGBI_Filename"].str.ends_with("_rgbi.tif").all()
+
+    def test_add_filename_columns_uppercase_extension(self):
+        """Test that only a lowercase .iiq extension is stripped."""
+        df = pl.DataFrame({"Filename": ["test.IIQ"]})
+
+        result = CoordinateProcessor.add_filename_columns(df)
+
+        assert result["RGBI_Filename"][0] == "test.IIQ_rgbi.tif"
+        assert result["RGB_Filename"][0] == "test.IIQ_cal.tif"
+
     def test_extract_coordinates_geographic(self):
         """Test extraction of geographic coordinates."""
         df = pl.DataFrame(
@@ -102,9 +344,10 @@ class TestCoordinateProcessor:
         )
 
         result = CoordinateProcessor.extract_coordinates(df, "dd")
-        expected = [(-123.258333, 52.5125, 100.0), (-124.0, 53.0, 150.0)]
+        expected = np.array([[-123.258333, 52.5125, 100.0], [-124.0, 53.0, 150.0]])
 
-        assert result == expected
+        assert result.dtype == np.float64
+        np.testing.assert_array_equal(result, expected)
 
     def test_extract_coordinates_cartesian(self):
         """Test extraction of cartesian coordinates."""
@@ -117,9 +360,42 @@ class TestCoordinateProcessor:
         )
 
         result = CoordinateProcessor.extract_coordinates(df, "cart")
-        expected = [(500000.0, 6000000.0, 100.0), (501000.0, 6001000.0, 150.0)]
+        expected = np.array(
+            [[500000.0, 6000000.0, 100.0], [501000.0, 6001000.0, 150.0]]
+        )
+
+        assert result.dtype == np.float64
+        np.testing.assert_array_equal(result, expected)
+
 
-        assert result == expected
+class TestGridFileManager:
+    """Test GridFileManager class."""
+
+    def test_sync_skipped_when_marker_matches(self, tmp_path):
+        """Test that a recorded, intact sync skips the network sync."""
+        (tmp_path / "grid.tif").write_bytes(b"grid")
+
+        with patch(
+            "aco_camera_csv_converter.services.sync_missing_grid_files"
+        ) as mock_sync:
+            GridFileManager.sync(tmp_path)
+            GridFileManager.sync(tmp_path)
+
+        mock_sync.assert_called_once()
+
+    def test_sync_reruns_when_grid_files_change(self, tmp_path):
+        """Test that a missing grid file invalidates the sync marker."""
+        grid = tmp_path / "grid.tif"
+        grid.write_bytes(b"grid")
+
+        with patch(
+            "aco_camera_csv_converter.services.sync_missing_grid_files"
+        ) as mock_sync:
+            GridFileManager.sync(tmp_path)
+            grid.unlink()
+            GridFileManager.sync(tmp_path)
+
+        assert mock_sync.call_count == 2
 
 
 class TestTransformationService:
@@ -158,66 +434,61 @@ class TestTransformationService:
             }
         )
 
+    @pytest.fixture
+    def mock_csrs(self, mocker):
+        """CSRSTransformer mock, patched in for a single test."""
+        mocker.patch("aco_camera_csv_converter.services.GridFileManager.sync")
+        mock_transformer = Mock(
+            t_coords=CoordType.UTM10,
+            s_ref_frame=Reference.WGS84,
+            s_coords=CoordType.GEOG,
+            s_epoch=2020.0,
+            t_ref_frame=Reference.NAD83CSRS,
+            t_epoch=2002.0,
+        )
+        mock_transformer.return_value = np.array(
+            [[500000.0, 6000000.0, 100.0], [501000.0, 6001000.0, 150.0]]
+        )
+        mocker.patch(
+            "aco_camera_csv_converter.services.CSRSTransformer",
+            return_value=mock_transformer,
+        )
+        return mock_transformer
+
     def test_inspection_disabled(
-        self, sample_transformation_params, sample_geographic_df
+        self, mock_csrs, sample_transformation_params, sample_geographic_df
     ):
         """Test transformation service with inspection disabled."""
         service = TransformationService(enable_inspection=False)
 
-        # Mock CSRSTransformer to avoid actual transformation
-        with patch(
-            "aco_camera_csv_converter.services.CSRSTransformer"
-        ) as mock_transformer_class:
-            mock_transformer = Mock()
-            mock_transformer.t_coords = CoordType.UTM10
-            mock_transformer.return_value = [
-                (500000.0, 6000000.0, 100.0),
-                (501000.0, 6001000.0, 150.0),
-            ]
-            mock_transformer_class.return_value = mock_transformer
-
-            with patch("aco_camera_csv_converter.services.sync_missing_grid_files"):
-                result = service.transform_coordinates(
-                    sample_geographic_df,
-                    sample_transformation_params,
-                    coord_type="dd",
-                    should_transform=True,
-                )
+        result = service.transform_coordinates(
+            sample_geographic_df,
+            sample_transformation_params,
+            coord_type="dd",
+            should_transform=True,
+        )
 
         # Should have no inspection data
         assert service.inspect_transformation_input() is None
         assert isinstance(result, pl.DataFrame)
 
     def test_inspection_enabled(
-        self, sample_transformation_params, sample_geographic_df
+        self, mock_csrs, sample_transformation_params, sample_geographic_df
     ):
         """Test transformation service with inspection enabled."""
         service = TransformationService(enable_inspection=True)
 
-        # Mock CSRSTransformer to avoid actual transformation
-        with patch(
-            "aco_camera_csv_converter.services.CSRSTransformer"
-        ) as mock_transformer_class:
-            mock_transformer = Mock()
-            mock_transformer.t_coords = CoordType.UTM10
-            mock_transformer.s_ref_frame = Reference.WGS84
-            mock_transformer.s_coords = CoordType.GEOG
-            mock_transformer.s_epoch = 2020.0
-            mock_transformer.t_ref_frame = Reference.NAD83CSRS
-            mock_transformer.t_epoch = 2002.0
-            mock_transformer.return_value = [
-                (500000.0, 6000000.0, 100.0),
-                (501000.0, 6001000.0, 150.0),
-            ]
-            mock_transformer_class.return_value = mock_transformer
+        service.transform_coordinates(
+            sample_geographic_df,
+            sample_transformation_params,
+            coord_type="dd",
+            should_transform=True,
+        )
 
-            with patch("aco_camera_csv_converter.services.sync_missing_grid_files"):
-                service.transform_coordinates(
-                    sample_geographic_df,
-                    sample_transformation_params,
-                    coord_type="dd",
-                    should_transform=True,
-                )
+        # Coordinates should reach the transformer as a single (N, 3) array
+        coordinates = mock_csrs.call_args[0][0]
+        assert isinstance(coordinates, np.ndarray)
+        assert coordinates.shape == (2, 3)
 
         # Should have inspection data
         inspection_data = service.inspect_transformation_input()
@@ -243,5 +514,214 @@ class TestTransformationService:
         assert "RGBI_Filename" in result.columns
         assert "RGB_Filename" in result.columns
 
+        # Coordinates should pass through untouched
+        assert result["Longitude[deg]"][0] == -123.258333
+        assert result.schema["Origin (Latitude[deg]"] == pl.Float64
+
         # Should have no inspection data since no transformation occurred
         assert service.inspect_transformation_input() is None
+
+    def test_no_transformation_mode_keeps_dms_strings(self):
+        """Test that filename-only updates leave DMS coordinates as uploaded."""
+        service = TransformationService(enable_inspection=False)
+        df = pl.DataFrame(
+            {
+                "Filename": ["img1.iiq"],
+                "Origin (Latitude[deg]": ["N52° 30' 45\""],
+                "Longitude[deg]": ["W123° 15' 30\""],
+            }
+        )
+
+        result = service.transform_coordinates(
+            df, transformation_params=None, coord_type="dms", should_transform=False
+        )
+
+        assert result["Origin (Latitude[deg]"].to_list() == ["N52° 30' 45\""]
+        assert result["RGBI_Filename"].to_list() == ["img1_rgbi.tif"]
+
+    def test_transformer_is_cached_per_parameters(self, sample_transformation_params):
+        """Test that transformers are built once per parameter set."""
+        service = TransformationService(enable_inspection=False)
+
+        with patch(
+            "aco_camera_csv_converter.services.CSRSTransformer"
+        ) as mock_transformer_class:
+            first = service.get_transformer(sample_transformation_params)
+            second = service.get_transformer(sample_transformation_params)
+
+        assert first is second
+        mock_transformer_class.assert_called_once_with(
+            **sample_transformation_params.to_csrspy_kwargs()
+        )
+
+    def test_grid_files_synced_once(self):
+        """Test that grid files are only synced on the first request."""
+        service = TransformationService(enable_inspection=False)
+
+        with patch(
+            "aco_camera_csv_converter.services.GridFileManager.sync"
+        ) as mock_sync:
+            service.ensure_grid_files()
+            service.ensure_grid_files()
+
+        mock_sync.assert_called_once()
+
+    def test_projected_output_columns(self, sample_geographic_df):
+        """Test transformed coordinates are attached as projected columns."""
+        service = TransformationService(enable_inspection=False)
+        processed_lf = CoordinateProcessor.preprocess_dataframe(
+            sample_geographic_df, "dd"
+        )
+        transformed = np.array(
+            [[500000.0, 6000000.0, 100.0], [501000.0, 6001000.0, 150.0]]
+        )
+
+        result = service._apply_transformed_coordinates(
+            processed_lf, transformed, CoordType.UTM10, "dd"
+        ).collect()
+
+        assert result.columns[:6] == [
+            "Timestamp",
+            "RGBI_Filename",
+            "RGB_Filename",
+            "Easting[m]",
+            "Northing[m]",
+            "Altitude[m]",
+        ]
+        assert result["Easting[m]"].to_list() == [500000.0, 501000.0]
+        assert result["Northing[m]"].to_list() == [6000000.0, 6001000.0]
+        assert result["Altitude[m]"].to_list() == [100.0, 150.0]
+
+    def test_transform_coordinates_lazy(self, sample_geographic_df):
+        """Test the lazy pipeline only materializes when collected."""
+        service = TransformationService(enable_inspection=True)
+        params = TransformationParameters(
+            s_ref_frame=Reference.WGS84,
+            s_coords=CoordType.GEOG,
+            s_epoch=2020.0,
+            s_vd=VerticalDatum.WGS84,
+            t_ref_frame=Reference.NAD83CSRS,
+            t_coords=CoordType.UTM10,
+            t_epoch=2002.0,
+            t_vd=VerticalDatum.CGG2013A,
+        )
+
+        with (
+            patch("aco_camera_csv_converter.services.GridFileManager.sync"),
+            patch(
+                "aco_camera_csv_converter.services.CSRSTransformer"
+            ) as mock_transformer_class,
+        ):
+            mock_transformer = Mock()
+            mock_transformer.t_coords = CoordType.UTM10
+            mock_transformer.side_effect = lambda chunk: (row + 1 for row in chunk)
+            mock_transformer_class.return_value = mock_transformer
+
+            result = service.transform_coordinates_lazy(
+                sample_geographic_df.lazy(), params, coord_type="dd"
+            )
+            assert isinstance(result, pl.LazyFrame)
+            result = result.collect()
+
+        expected = sample_geographic_df["Longitude[deg]"] + 1
+        assert result["Easting[m]"].to_list() == expected.to_list()
+        summary = service.inspect_transformation_input()
+        assert summary["num_coordinates"] == sample_geographic_df.height
+
+    def test_detect_dms_after_leading_nulls(self, sample_transformation_params):
+        """Test DMS detection looks past leading rows without a latitude."""
+        service = TransformationService(enable_inspection=True)
+        n_blank = 40
+        angles = [0.0] * (n_blank + 1)
+        df = pl.DataFrame(
+            {
+                "Timestamp": ["2023-01-01"] * (n_blank + 1),
+                "Filename": ["img.iiq"] * (n_blank + 1),
+                "Origin (Latitude[deg]": [None] * n_blank + ["N52° 30' 45\""],
+                "Longitude[deg]": [None] * n_blank + ["W123° 15' 30\""],
+                "Altitude[m])": [100.0] * (n_blank + 1),
+                "Roll(X)[deg]": angles,
+                "Pitch(Y)[deg]": angles,
+                "Yaw(Z)[deg]": angles,
+                "Omega[deg]": angles,
+                "Phi[deg]": angles,
+                "Kappa[deg]": angles,
+            }
+        )
+
+        with (
+            patch("aco_camera_csv_converter.services.GridFileManager.sync"),
+            patch(
+                "aco_camera_csv_converter.services.CSRSTransformer"
+            ) as mock_transformer_class,
+        ):
+            mock_transformer = Mock()
+            mock_transformer.t_coords = CoordType.UTM10
+            mock_transformer.side_effect = lambda chunk: (row + 1 for row in chunk)
+            mock_transformer_class.return_value = mock_transformer
+
+            result = service.transform_coordinates(df, sample_transformation_params)
+
+        assert service.inspect_transformation_input()["coordinate_type"] == "dms"
+        assert result["Easting[m]"][-1] == pytest.approx(
+            -(123 + 15 / 60 + 30 / 3600) + 1
+        )
+
+    def test_transformer_runs_in_chunks(self):
+        """Test that coordinates are transformed in fixed-size chunks."""
+        service = TransformationService(enable_inspection=False)
+        service.TRANSFORM_CHUNK_SIZE = 2
+        coordinates = np.arange(15, dtype=np.float64).reshape(5, 3)
+        transformer = Mock(side_effect=lambda chunk: (row + 1 for row in chunk))
+
+        result = service._run_transformer(transformer, coordinates)
+
+        assert transformer.call_count == 3
+        assert result.T[0].flags["C_CONTIGUOUS"]
+        np.testing.assert_array_equal(result, coordinates + 1)
+
+    def test_transform_points_uses_array_pipelines(self):
+        """Test that csrspy pipelines are applied to whole coordinate arrays."""
+        step = Mock()
+        step.transform.side_effect = lambda x, y, z, t, direction: (
+            x + 1,
+            y + 2,
+            z + t,
+            t,
+        )
+        pipeline = Mock(transforms=[step], direction="forward", s_epoch=2002.0)
+        transformer = Mock(transformers=[pipeline])
+        points = np.array([[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]])
+
+        result = TransformationService.transform_points(transformer, points)
+
+        transformer.assert_not_called()
+        assert step.transform.call_count == 1
+        assert step.transform.call_args.kwargs["direction"] == "forward"
+        np.testing.assert_array_equal(result, [[2.0, 4.0, 2005.0], [5.0, 7.0, 2008.0]])
+
+    def test_transform_points_matches_csrspy(self):
+        """Test that array transforms match CSRSTransformer's own results."""
+        points = np.array(
+            [[-125.0, 50.0, 100.0], [-123.258333, 52.5125, 150.0], [-130.5, 55.0, 0.0]]
+        )
+        # Matching epochs need no PROJ grid files; ITRF08 output chains a
+        # second pipeline back out of NAD83(CSRS)
+        for t_ref_frame, t_coords in (
+            (Reference.NAD83CSRS, CoordType.UTM10),
+            (Reference.ITRF08, CoordType.CART),
+        ):
+            transformer = CSRSTransformer(
+                s_ref_frame=Reference.ITRF14,
+                s_coords=CoordType.GEOG,
+                s_epoch=2020.0,
+                s_vd=VerticalDatum.GRS80,
+                t_ref_frame=t_ref_frame,
+                t_coords=t_coords,
+                t_epoch=2020.0,
+                t_vd=VerticalDatum.GRS80,
+            )
+
+            result = TransformationService.transform_points(transformer, points)
+
+            np.testing.assert_array_equal(result, list(transformer(points.tolist())))